@@ -7,6 +7,7 @@ Prueba las funcionalidades de detección WiFi en cada sistema operativo
 import subprocess
 import platform
 import sys
+import os
 import json
 from datetime import datetime
 
@@ -490,6 +491,25 @@ def test_iperf3():
         print(f"❌ Error probando iperf3: {e}")
         return False
 
+def test_backend_probe():
+    """Prueba concurrente de los métodos de detección del programa principal.
+
+    Guarda el perfil de capacidades que la aplicación carga al iniciar para
+    usar directamente el método más rápido que funciona.
+    """
+    print("\n⏱️  Probando métodos de detección en paralelo...")
+    print("=" * 45)
+
+    main_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'HEAT-MAPPER.PY')
+    try:
+        result = subprocess.run([sys.executable, main_script, '--probe'],
+                                capture_output=True, text=True, timeout=120)
+        print(result.stdout.strip() or result.stderr.strip())
+        return result.returncode == 0
+    except Exception as e:
+        print(f"❌ Error ejecutando la prueba de métodos: {e}")
+        return False
+
 def test_python_dependencies():
     """Prueba las dependencias de Python"""
     print("\n🐍 Probando dependencias de Python...")
@@ -555,7 +575,7 @@ def main():
     
     # Contador de pruebas exitosas
     successful_tests = 0
-    total_tests = 3
+    total_tests = 4
     
     # Prueba 1: Dependencias Python
     if test_python_dependencies():
@@ -569,6 +589,10 @@ def main():
     if test_iperf3():
         successful_tests += 1
     
+    # Prueba 4: perfil de métodos de detección
+    if test_backend_probe():
+        successful_tests += 1
+    
     # Generar reporte
     generate_report()
     
@@ -580,10 +604,10 @@ def main():
     if successful_tests == total_tests:
         print("🎉 ¡TODAS LAS PRUEBAS EXITOSAS!")
         print("   La aplicación WiFi Heatmap Generator debería funcionar perfectamente.")
-    elif successful_tests >= 2:
+    elif successful_tests >= 3:
         print("✅ MAYORÍA DE PRUEBAS EXITOSAS")
         print("   La aplicación debería funcionar con funcionalidad limitada.")
-        if successful_tests == 2:
+        if successful_tests == 3:
             print("   Considera instalar las dependencias faltantes para funcionalidad completa.")
     else:
         print("⚠️  POCAS PRUEBAS EXITOSAS")